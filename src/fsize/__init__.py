@@ -35,8 +35,10 @@ Examples
     1048576.0
 """
 
-import math
 import re
+import sys
+from collections.abc import Iterable
+from math import floor as _floor, log10 as _log10
 from typing import Any, Self
 
 __all__ = ["FSize"]
@@ -52,14 +54,124 @@ _UNIT_POWERS: dict[str, int] = {
     "E": 6,
 }
 
-_RE_STR_PARSE = re.compile(
-    r"(\d*\.?\d+)\s*([KkMmGgTtPpEe]?i?[Bb])?\s*$"
-)
-_RE_UNITS = re.compile(r"([KkMmGgTtPpEe])?(i)?[Bb]$")
-_RE_FORMAT_SPEC = re.compile(
-    r"^(?:(?P<fill>.)??(?P<align>[<>^])?)"
-    r"(?P<width>\d+)?(?P<grouping>[_,])?(?P<unit>[KkMmGgTtPpEe])?i?[Bb]?$"
-)
+_RE_STR_PARSE = re.compile(r"(\d*\.?\d+)\s*([KkMmGgTtPpEe]?i?[Bb])?\s*$")
+
+
+def _parse_format_spec(spec: str) -> tuple[str, str, int, str, str] | None:
+    """Parse an FSize format specifier.
+
+    Scans ``spec`` left to right for the optional fill, align, width,
+    grouping, and unit fields of the
+    ``[fill][align][width][grouping][unit][i][B]`` mini-language.  A
+    character-by-character scan of these short strings avoids the
+    regular expression engine and Match allocation on every format
+    call.
+
+    Args:
+        spec (str): The (non-empty) format specifier.
+
+    Returns:
+        tuple[str, str, int, str, str] | None: The parsed
+        ``(fill, align, width, grouping, unit)`` fields with defaults
+        applied, or None if the specifier is malformed.
+    """
+    end = len(spec)
+    # Candidate (fill, align, pos) interpretations of the leading
+    # characters, in the order the regex's lazy fill group tried them:
+    # align alone, neither, then an explicit fill character.
+    candidates = [("", spec[0], 1)] if spec[0] in "<>^" else []
+    candidates.append(("", "", 0))
+    if end >= 2 and spec[1] in "<>^":
+        candidates.append((spec[0], spec[1], 2))
+    else:
+        candidates.append((spec[0], "", 1))
+    for fill, align, pos in candidates:
+        start = pos
+        while pos < end and spec[pos].isdecimal():
+            pos += 1
+        width = int(spec[start:pos]) if pos > start else 0
+        grouping = ""
+        if pos < end and spec[pos] in "_,":
+            grouping = spec[pos]
+            pos += 1
+        unit = "K"
+        if pos < end and spec[pos] in "KkMmGgTtPpEe":
+            unit = spec[pos].upper()
+            pos += 1
+        if pos < end and spec[pos] == "i":
+            pos += 1
+        if pos < end and spec[pos] in "Bb":
+            pos += 1
+        if pos == end:
+            return fill, align, width, grouping, unit
+    return None
+
+
+def _build_units_table() -> dict[str, tuple[float, int]]:
+    """Build the lookup table of accepted unit strings.
+
+    Maps every accepted unit spelling (e.g. "KiB", "kb", "B") to a
+    ``(factor, base)`` tuple, where ``factor`` converts a value in
+    those units to bytes with a single multiplication.  Binary units
+    (with an "i", or the bare byte unit) use base 1024; decimal units
+    use base 1000.
+
+    Returns:
+        dict[str, tuple[float, int]]: The unit lookup table.
+    """
+    table: dict[str, tuple[float, int]] = {}
+    for byte in ("B", "b"):
+        table[byte] = (1.0, 1024)
+        table["i" + byte] = (1.0, 1024)
+        for letter, power in _UNIT_POWERS.items():
+            for prefix in (letter, letter.lower()):
+                table[prefix + byte] = (1000.0**power, 1000)
+                table[prefix + "i" + byte] = (1024.0**power, 1024)
+    # Intern the keys so lookups with literal unit strings (interned by
+    # the compiler) hit the dict's pointer-identity fast path.
+    return {sys.intern(key): value for key, value in table.items()}
+
+
+_UNITS_TABLE: dict[str, tuple[float, int]] = _build_units_table()
+
+# Precomputed divisors (base ** power) shared by all instances, so the
+# to_* accessors do a single division instead of re-raising the
+# conversion factor to a power on every call.
+_DIVISORS: dict[int, tuple[float, ...]] = {
+    base: tuple(float(base) ** power for power in range(7))
+    for base in (1000, 1024)
+}
+
+# Powers of ten for _digit_count; 312 entries cover every finite float.
+_POW10: tuple[int, ...] = tuple(10**power for power in range(312))
+
+
+def _digit_count(n: float) -> int:
+    """Return the decimal digits in the integer part of n.
+
+    An integer bit_length-based digit count used by __format__ in
+    place of math.log10 on the common path.  The bit-length estimate
+    underestimates by at most one digit and is made exact against the
+    power-of-ten table.
+
+    Args:
+        n (float): A finite value with ``n >= 1``.
+
+    Returns:
+        int: The number of digits, ``floor(log10(n)) + 1``.
+    """
+    m = int(n)
+    # 30102 / 100000 slightly underestimates log10(2), so the estimate
+    # needs at most one upward correction.
+    digits = (m.bit_length() - 1) * 30102 // 100000 + 1
+    if m >= _POW10[digits]:
+        digits += 1
+    if m + 1 >= _POW10[digits]:
+        # Within one unit of the next power of ten the result is
+        # sensitive to log10's final-bit rounding; defer to it so the
+        # precision chosen for formatting is unchanged.
+        return _floor(_log10(n)) + 1
+    return digits
 
 
 class FSize(float):
@@ -69,7 +181,12 @@ class FSize(float):
     other units (KiB, MiB, GiB, TiB, PiB, EiB or KB, MB, GB, TB, PB, EB).
     """
 
+    # Keep instances compact: without __slots__ the attribute
+    # assignments in __new__ would give every instance a __dict__.
+    __slots__ = ("_convert", "_divisors")
+
     _convert: float
+    _divisors: tuple[float, ...]
 
     def __new__(cls, value: Any, units: str = "B") -> Self:
         """Create a new FSize instance.
@@ -84,44 +201,100 @@ class FSize(float):
                 "TiB", "PiB", "EiB" or "KB", "MB", "GB", "TB", "PB", "EB".
                 The default is "B" (Bytes).
         """
-        try:
-            if isinstance(value, str):
-                m = _RE_STR_PARSE.match(value)
-                if m is None:
-                    raise ValueError
-                value = m.group(1)
-                if m.group(2) is not None:
-                    units = m.group(2)
-            # Check if the value can be cast to a float
+        # Fast path: plain floats and ints (the common case) need no
+        # string parsing and no exception handling setup.  The exact
+        # type checks are deliberate so that subclasses such as bool
+        # keep taking the generic conversion path.
+        # pylint: disable-next=unidiomatic-typecheck
+        if type(value) is int:
             value = float(value)
-        except ValueError as exc:
-            raise ValueError(
-                f"could not convert value to {cls.__name__}: '{value}'"
-            ) from exc
+        # pylint: disable-next=unidiomatic-typecheck
+        elif type(value) is not float:
+            try:
+                if isinstance(value, str):
+                    m = _RE_STR_PARSE.match(value)
+                    if m is None:
+                        raise ValueError
+                    value = m.group(1)
+                    if m.group(2) is not None:
+                        units = m.group(2)
+                # Check if the value can be cast to a float
+                value = float(value)
+            except ValueError as exc:
+                raise ValueError(
+                    f"could not convert value to {cls.__name__}: '{value}'"
+                ) from exc
         # The value must be a positive number
         if value < 0:
             raise ValueError(f"{cls.__name__} cannot be negative: {value}")
-        # Perform the conversion to Bytes based on the units given:
-        in_units = _RE_UNITS.match(units)
-        if in_units is None:
-            raise ValueError(f"Unknown units: {units}")
-        has_i = in_units[2] is not None
-        no_prefix = in_units[1] is None
-        convert = 1024 if (has_i or no_prefix) else 1000
-        if in_units[1] is not None:
-            prefix = in_units[1].upper()
-            value *= convert ** _UNIT_POWERS[prefix]
+        # Perform the conversion to Bytes based on the units given.
+        # Bare bytes (the most common input) need no table lookup or
+        # multiplication at all.
+        if units in ("B", "b"):
+            convert = 1024
+        else:
+            try:
+                factor, convert = _UNITS_TABLE[units]
+            except KeyError:
+                raise ValueError(f"Unknown units: {units}") from None
+            value *= factor
         instance = super().__new__(cls, value)
         instance._convert = convert
+        instance._divisors = _DIVISORS[convert]
         return instance
 
+    @classmethod
+    def from_iter(cls, values: Iterable[Any], units: str = "B") -> list[Self]:
+        """Create a list of FSize instances from an iterable of values.
+
+        Resolves the units once and reuses the conversion factor for
+        every element, which is faster than calling ``FSize(value,
+        units)`` in a loop when wrapping many sizes at once (e.g. the
+        output of ``os.scandir``).
+
+        Args:
+            values (Iterable[Any]): Numeric sizes, all in ``units``.
+            units (str): The units of every value. Can be "KiB", "MiB",
+                "GiB", "TiB", "PiB", "EiB" or "KB", "MB", "GB", "TB",
+                "PB", "EB". The default is "B" (Bytes).
+
+        Returns:
+            list[Self]: The sizes as FSize instances.
+
+        Raises:
+            ValueError: If the units are unknown, or a value is
+                negative or cannot be converted.
+        """
+        if units in ("B", "b"):
+            factor, convert = 1.0, 1024
+        else:
+            try:
+                factor, convert = _UNITS_TABLE[units]
+            except KeyError:
+                raise ValueError(f"Unknown units: {units}") from None
+        divisors = _DIVISORS[convert]
+        new = super().__new__
+        result: list[Self] = []
+        for value in values:
+            value = float(value)
+            if value < 0:
+                raise ValueError(f"{cls.__name__} cannot be negative: {value}")
+            instance = new(cls, value * factor)
+            instance._convert = convert
+            instance._divisors = divisors
+            result.append(instance)
+        return result
+
     def __str__(self) -> str:
         """Return the string representation of the FSize value.
 
         Returns:
             str: The string representation of the FSize value.
         """
-        return f"{self.real}"
+        # float.__repr__ is called directly: self.real allocates an
+        # intermediate float, and f-string formatting goes through the
+        # full format-spec machinery for the same output.
+        return float.__repr__(self)
 
     def __repr__(self) -> str:
         """Return an unambiguous representation of the FSize value.
@@ -129,7 +302,7 @@ class FSize(float):
         Returns:
             str: A representation that identifies the type and value.
         """
-        return f"FSize({self.real})"
+        return f"FSize({float.__repr__(self)})"
 
     def __format__(self, format_spec: str) -> str:
         """Format the FSize value.
@@ -171,44 +344,25 @@ class FSize(float):
         if not format_spec:
             return str(self)
 
-        # Default values for format specifiers
-        fill = ""
-        align = ""
-        width = 0
-        grouping = ""
-        unit = "K"
-
-        match = _RE_FORMAT_SPEC.match(format_spec)
-        if match:
-            fill = match.group("fill") or fill
-            align = match.group("align") or align
-            width = (
-                int(match.group("width"))
-                if match.group("width")
-                else width
-            )
-            grouping = match.group("grouping") or grouping
-            unit = (match.group("unit") or unit).upper()
-        else:
+        parsed = _parse_format_spec(format_spec)
+        if parsed is None:
             raise ValueError(
                 f"Unknown format code '{format_spec}' "
                 f"for object of type '{self.__class__.__name__}'"
             )
+        fill, align, width, grouping, unit = parsed
 
         # Convert the number to the appropriate unit
         if unit not in _UNIT_POWERS:
             raise AssertionError(f"unhandled unit: {unit!r}")
-        n = self.real / self._convert ** _UNIT_POWERS[unit]
+        n = self.real / self._divisors[_UNIT_POWERS[unit]]
 
-        log_digits = math.floor(math.log10(n)) + 1 if n > 0 else 0
+        log_digits = _digit_count(n) if n >= 1.0 else 0
         out_format_spec = (
-            f"{fill}{align}{width}{grouping}"
-            + "."
-            + str(max(0, width, log_digits))
-            + "g"
+            f"{fill}{align}{width}{grouping}.{max(0, width, log_digits)}g"
         )
         try:
-            return f"{n:{out_format_spec}}"
+            return format(n, out_format_spec)
         except Exception as exc:
             raise ValueError(
                 f"Unknown format code '{format_spec}' "
@@ -229,7 +383,7 @@ class FSize(float):
         Returns:
             float: The value in KB or KiB.
         """
-        return self.real / self._convert
+        return self.real / self._divisors[1]
 
     def to_m(self) -> float:
         """Return the value in MB or MiB.
@@ -237,7 +391,7 @@ class FSize(float):
         Returns:
             float: The value in MB or MiB.
         """
-        return self.real / self._convert**2
+        return self.real / self._divisors[2]
 
     def to_g(self) -> float:
         """Return the value in GB or GiB.
@@ -245,7 +399,7 @@ class FSize(float):
         Returns:
             float: The value in GB or GiB.
         """
-        return self.real / self._convert**3
+        return self.real / self._divisors[3]
 
     def to_t(self) -> float:
         """Return the value in TB or TiB.
@@ -253,7 +407,7 @@ class FSize(float):
         Returns:
             float: The value in TB or TiB.
         """
-        return self.real / self._convert**4
+        return self.real / self._divisors[4]
 
     def to_p(self) -> float:
         """Return the value in PB or PiB.
@@ -261,7 +415,7 @@ class FSize(float):
         Returns:
             float: The value in PB or PiB.
         """
-        return self.real / self._convert**5
+        return self.real / self._divisors[5]
 
     def to_e(self) -> float:
         """Return the value in EB or EiB.
@@ -269,4 +423,4 @@ class FSize(float):
         Returns:
             float: The value in EB or EiB.
         """
-        return self.real / self._convert**6
+        return self.real / self._divisors[6]
@@ -187,6 +187,15 @@ def test_exbibyte():
     assert var2._convert == 1024
 
 
+def test_unit_i_without_prefix():
+    """Test initialization of FSize with an 'i' unit and no prefix"""
+    var = FSize(1024, "iB")
+    assert isinstance(var, FSize)
+    assert var == 1024
+    assert var._convert == 1024
+    assert FSize(1024, "ib") == 1024
+
+
 def test_invalid_unit():
     """Test initialization of FSize with an invalid unit"""
     with pytest.raises(ValueError) as exc:
@@ -291,6 +300,14 @@ def test_zero():
     assert format(FSize(0), "K") == "0"
 
 
+def test_no_instance_dict():
+    """Test that FSize instances are slotted and carry no __dict__"""
+    var = FSize(1024)
+    assert not hasattr(var, "__dict__")
+    with pytest.raises(AttributeError):
+        var.extra = 1  # type: ignore[attr-defined]
+
+
 def test_negative_value():
     """Test that a negative value raises ValueError"""
     with pytest.raises(ValueError) as exc:
@@ -298,6 +315,52 @@ def test_negative_value():
     assert "cannot be negative" in str(exc.value)
 
 
+def test_from_iter():
+    """Test bulk construction from an iterable with binary units"""
+    sizes = FSize.from_iter([1, 2.5, 0], "KiB")
+    assert [s.real for s in sizes] == [1024.0, 2560.0, 0.0]
+    assert all(isinstance(s, FSize) for s in sizes)
+    assert all(s._convert == 1024 for s in sizes)
+
+
+def test_from_iter_default_units():
+    """Test bulk construction with the default byte units"""
+    sizes = FSize.from_iter(range(3))
+    assert sizes == [FSize(0), FSize(1), FSize(2)]
+    assert sizes[1]._convert == 1024
+
+
+def test_from_iter_decimal_units():
+    """Test bulk construction with decimal units"""
+    sizes = FSize.from_iter([1, 2], "MB")
+    assert sizes[0] == FSize(1, "MB")
+    assert sizes[1] == FSize(2, "MB")
+    assert all(s._convert == 1000 for s in sizes)
+
+
+def test_from_iter_matches_single_construction():
+    """Test that bulk construction matches FSize(value, units)"""
+    values = [0, 1, 1.5, 123456789.0]
+    for units in ("B", "KiB", "MB", "EiB"):
+        assert FSize.from_iter(values, units) == [
+            FSize(value, units) for value in values
+        ]
+
+
+def test_from_iter_invalid_units():
+    """Test that bulk construction rejects unknown units"""
+    with pytest.raises(ValueError) as exc:
+        FSize.from_iter([1, 2], "invalid")
+    assert "Unknown units: invalid" in str(exc.value)
+
+
+def test_from_iter_negative_value():
+    """Test that bulk construction rejects negative values"""
+    with pytest.raises(ValueError) as exc:
+        FSize.from_iter([1, -2], "KiB")
+    assert "cannot be negative" in str(exc.value)
+
+
 def test_to_bytes():
     """Test conversion to bytes"""
     assert FSize(1024).to_bytes() == 1024.0
@@ -482,4 +545,3 @@ def test_format_combined_spec():
     # Just unit (no optional fields)
     assert float(format(x, "KiB")) == pytest.approx(1024.0)
     assert float(format(x, "MiB")) == pytest.approx(1.0)
-